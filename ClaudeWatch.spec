@@ -5,13 +5,18 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['rumps', 'requests', 'urllib3', 'certifi'],
+    hiddenimports=['rumps', 'certifi'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=['tkinter', 'matplotlib', 'numpy', 'PIL', 'scipy'],
+    excludes=[
+        'tkinter', 'matplotlib', 'numpy', 'PIL', 'scipy',
+        'unittest', 'pydoc', 'pydoc_data', 'xmlrpc', 'distutils', 'lib2to3',
+        'test', 'tests', 'email.mime', 'html', 'http.server', 'xml.dom', 'xml.sax',
+        'xml.etree', 'multiprocessing', 'concurrent', 'asyncio',
+    ],
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
 
 pyz = PYZ(a.pure)
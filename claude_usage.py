@@ -5,23 +5,72 @@ A simple macOS menu bar app to track Claude Code Pro/Max usage limits.
 """
 
 import rumps
+import objc
+import calendar
+import certifi
 import subprocess
-import requests
 import json
 import logging
+import random
+import ssl
+import threading
 import time
 from datetime import datetime
+from functools import lru_cache
+from http.client import HTTPException, HTTPSConnection, RemoteDisconnected
 from pathlib import Path
+from socket import timeout as SocketTimeout
+from AppKit import NSWorkspace, NSWorkspaceWillSleepNotification, NSWorkspaceDidWakeNotification
+from Foundation import NSObject, NSDistributedNotificationCenter
+from PyObjCTools import AppHelper
+
+try:
+    from Security import (
+        SecItemCopyMatching, kSecClass, kSecClassGenericPassword,
+        kSecAttrService, kSecReturnData, kSecMatchLimit, kSecMatchLimitOne,
+        kSecUseAuthenticationUI, kSecUseAuthenticationUIFail
+    )
+except ImportError:  # pyobjc-framework-Security not installed, use the security CLI
+    SecItemCopyMatching = None
+
+try:
+    from CoreFoundation import CFRunLoopGetMain, kCFRunLoopCommonModes
+    from SystemConfiguration import (
+        SCNetworkReachabilityCreateWithName, SCNetworkReachabilityGetFlags,
+        SCNetworkReachabilitySetCallback, SCNetworkReachabilityScheduleWithRunLoop,
+        kSCNetworkReachabilityFlagsReachable, kSCNetworkReachabilityFlagsConnectionRequired,
+        kSCNetworkReachabilityFlagsConnectionOnTraffic, kSCNetworkReachabilityFlagsConnectionOnDemand,
+        kSCNetworkReachabilityFlagsInterventionRequired
+    )
+except ImportError:  # pyobjc-framework-SystemConfiguration not installed, always try the network
+    SCNetworkReachabilityCreateWithName = None
 
 # Configuration
 POLL_INTERVAL = 120  # seconds (2 minutes)
+POLL_JITTER = 15  # +/- seconds, so many clients don't poll in lockstep
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds between retries
-THRESHOLDS = {
-    'warning': 0.70,
-    'danger': 0.85,
-    'critical': 0.95
+RETRY_DELAY = 5  # base seconds between retries, doubled per attempt
+TOKEN_EXPIRY_MARGIN = 60  # seconds before expiresAt to treat the token as stale
+USAGE_CACHE_TTL = 30  # seconds to reuse a successful response before calling the API again
+KEEPALIVE_EXPIRY = 150  # seconds; above the jittered poll gap so timer polls reuse the connection
+KEYCHAIN_SERVICE = 'Claude Code-credentials'
+API_HOST = 'api.anthropic.com'
+USAGE_PATH = '/api/oauth/usage'
+# (level, threshold, icon), in ascending order
+THRESHOLDS = (
+    ('warning', 0.70, '🟡'),
+    ('danger', 0.85, '🟠'),
+    ('critical', 0.95, '🔴'),
+)
+WARNING_THRESHOLD = THRESHOLDS[0][1]
+NOTIFICATIONS = {
+    'warning': ("Usage Warning", "You've reached {pct} of your {label}."),
+    'danger': ("Usage High", "You've used {pct} of your {label}."),
+    'critical': ("Usage Critical!", "You've used {pct} of your {label}. Consider pausing."),
 }
+LIMIT_LABELS = ("5h limit", "Weekly limit")
+NOTIFY_COOLDOWN = 300  # seconds before the same limit/level can notify again
+PERCENT_STRINGS = tuple(f"{i}%" for i in range(101))
 
 # Setup logging
 LOG_PATH = Path.home() / "Library/Logs/claude-usage-monitor.log"
@@ -36,6 +85,71 @@ logging.basicConfig(
 log = logging.getLogger(__name__)
 
 
+def retry_delay(attempt):
+    """Exponential backoff with jitter for the given zero-based attempt."""
+    return RETRY_DELAY * 2 ** attempt + random.random()
+
+
+def format_percent(pct):
+    """Format a 0-1 fraction as a whole percentage, e.g. 0.42 -> '42%'."""
+    num = round(pct * 100)  # utilization / 100 * 100 can land just below the integer
+    return PERCENT_STRINGS[num] if 0 <= num <= 100 else f"{num}%"
+
+
+@lru_cache(maxsize=64)
+def parse_reset_epoch(iso_time):
+    """Convert an ISO 8601 reset time to epoch seconds.
+
+    Cached because the API returns the same resets_at across many polls.
+    """
+    try:
+        # Fast path for the UTC "YYYY-MM-DDTHH:MM:SS[.ffffff](Z|+00:00)" form the API returns
+        if iso_time[10] != 'T' or iso_time[19:].lstrip('.0123456789') not in ('Z', '+00:00'):
+            raise ValueError(iso_time)
+        return calendar.timegm((
+            int(iso_time[0:4]), int(iso_time[5:7]), int(iso_time[8:10]),
+            int(iso_time[11:13]), int(iso_time[14:16]), int(iso_time[17:19]),
+            0, 0, 0
+        ))
+    except (ValueError, IndexError):
+        return datetime.fromisoformat(iso_time.replace('Z', '+00:00')).timestamp()
+
+
+class PowerObserver(NSObject):
+    """Forwards sleep/wake and screen lock notifications to the app."""
+
+    def initWithApp_(self, app):
+        self = objc.super(PowerObserver, self).init()
+        if self is None:
+            return None
+        self.app = app
+
+        workspace_center = NSWorkspace.sharedWorkspace().notificationCenter()
+        workspace_center.addObserver_selector_name_object_(
+            self, 'willSleep:', NSWorkspaceWillSleepNotification, None)
+        workspace_center.addObserver_selector_name_object_(
+            self, 'didWake:', NSWorkspaceDidWakeNotification, None)
+
+        distributed_center = NSDistributedNotificationCenter.defaultCenter()
+        distributed_center.addObserver_selector_name_object_(
+            self, 'screenLocked:', 'com.apple.screenIsLocked', None)
+        distributed_center.addObserver_selector_name_object_(
+            self, 'screenUnlocked:', 'com.apple.screenIsUnlocked', None)
+        return self
+
+    def willSleep_(self, notification):
+        self.app.pause_polling('sleep')
+
+    def didWake_(self, notification):
+        self.app.resume_polling('sleep')
+
+    def screenLocked_(self, notification):
+        self.app.pause_polling('locked')
+
+    def screenUnlocked_(self, notification):
+        self.app.resume_polling('locked')
+
+
 class ClaudeUsageApp(rumps.App):
     def __init__(self):
         super().__init__("⏳", quit_button=None)
@@ -59,38 +173,54 @@ class ClaudeUsageApp(rumps.App):
 
         # State
         self.token = None
-        self.notified_levels = set()
+        self.token_expires_at = None  # ms epoch, from the OAuth credentials
+        self.notified_levels = {label: {} for label in LIMIT_LABELS}  # level -> monotonic time sent
         self.consecutive_failures = 0
         self.last_known_usage = None  # Cache for graceful degradation
+        self.last_fetched_at = 0.0  # monotonic time of last successful fetch
+        self.updated_at = None  # wall-clock time of last successful fetch, for display
         self.token_refresh_attempts = 0
+        self.fetch_in_progress = False
+        self.offline = False
+        self.shown_titles = {}  # id(item) -> last assigned title
+
+        # Reuse one HTTPS connection across polls instead of a fresh TLS handshake each time
+        self.ssl_context = ssl.create_default_context(cafile=certifi.where())
+        self.conn = None
+        self.last_request_at = 0.0
+
+        # Kernel-maintained reachability flags, so offline polls skip the network entirely
+        self.reachability = None
+        if SCNetworkReachabilityCreateWithName is not None:
+            self.reachability = SCNetworkReachabilityCreateWithName(None, API_HOST.encode())
+            SCNetworkReachabilitySetCallback(self.reachability, self.reachability_changed, None)
+            SCNetworkReachabilityScheduleWithRunLoop(
+                self.reachability, CFRunLoopGetMain(), kCFRunLoopCommonModes
+            )
 
         log.info("Claude Usage Monitor starting...")
 
-        # Start polling timer
-        self.timer = rumps.Timer(self.safe_refresh, POLL_INTERVAL)
-        self.timer.start()
-
-        # Initial fetch
-        self.safe_refresh(None)
+        # Start polling, paused while asleep or locked. The first poll is the
+        # initial fetch and runs as soon as the run loop starts
+        self.poll_generation = 0  # bumped to cancel a pending poll
+        self.pause_reasons = set()
+        self.power_observer = PowerObserver.alloc().initWithApp_(self)
+        self.schedule_poll(0)
 
     def get_token(self, force_refresh=False):
         """Read OAuth token from macOS Keychain with retry logic."""
-        if self.token and not force_refresh:
+        if self.token and not force_refresh and not self.token_expired():
             return self.token
 
         for attempt in range(MAX_RETRIES):
             try:
-                result = subprocess.run(
-                    ['security', 'find-generic-password',
-                     '-s', 'Claude Code-credentials', '-w'],
-                    capture_output=True, text=True, check=True, timeout=10
-                )
-                creds = json.loads(result.stdout.strip())
+                creds = json.loads(self.read_keychain())
                 oauth = creds.get('claudeAiOauth', {})
                 token = oauth.get('accessToken')
 
                 if token:
                     self.token = token
+                    self.token_expires_at = oauth.get('expiresAt')
                     self.token_refresh_attempts = 0
                     log.info("Token retrieved successfully")
                     return self.token
@@ -107,36 +237,141 @@ class ClaudeUsageApp(rumps.App):
                 log.error(f"Unexpected error getting token: {e}")
 
             if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY)
+                time.sleep(retry_delay(attempt))
 
-        # Only notify once per session about auth issues
+        # Only notify once per session about auth issues; this runs on the
+        # fetch thread, so post the notification from the main thread
         if self.token_refresh_attempts == 0:
             self.token_refresh_attempts += 1
-            rumps.notification(
+            AppHelper.callAfter(
+                rumps.notification,
                 "Claude Usage Monitor",
                 "Authentication Required",
                 "Run 'claude' in terminal first to authenticate."
             )
         return None
 
-    def fetch_usage(self):
+    def read_keychain(self):
+        """Return the raw credentials JSON stored by Claude Code."""
+        if SecItemCopyMatching is not None:
+            # In-process lookup, no fork/exec of /usr/bin/security. The item is
+            # created by the security CLI, so this process may not be on its ACL;
+            # fail instead of showing a prompt that would block the fetch thread
+            status, data = SecItemCopyMatching({
+                kSecClass: kSecClassGenericPassword,
+                kSecAttrService: KEYCHAIN_SERVICE,
+                kSecReturnData: True,
+                kSecMatchLimit: kSecMatchLimitOne,
+                kSecUseAuthenticationUI: kSecUseAuthenticationUIFail,
+            }, None)
+            if status == 0 and data is not None:
+                return bytes(data).decode('utf-8')
+            log.warning(f"Security framework lookup failed (status {status}), using security CLI")
+
+        result = subprocess.run(
+            ['security', 'find-generic-password',
+             '-s', KEYCHAIN_SERVICE, '-w'],
+            capture_output=True, text=True, check=True, timeout=10
+        )
+        return result.stdout.strip()
+
+    def token_expired(self):
+        """Check whether the cached token is at or near its expiresAt."""
+        if not self.token_expires_at:
+            return False  # Unknown expiry, rely on 401 handling
+        return time.time() * 1000 >= self.token_expires_at - TOKEN_EXPIRY_MARGIN * 1000
+
+    def network_reachable(self, flags=None):
+        """Check whether API_HOST is reachable without touching the network."""
+        if flags is None:
+            if self.reachability is None:
+                return True
+            ok, flags = SCNetworkReachabilityGetFlags(self.reachability, None)
+            if not ok:
+                return True  # Unknown, let the request decide
+        if not flags & kSCNetworkReachabilityFlagsReachable:
+            return False
+        if not flags & kSCNetworkReachabilityFlagsConnectionRequired:
+            return True
+        # As in Apple's Reachability sample: an on-demand/on-traffic connection
+        # (e.g. VPN) comes up by itself on the first request unless the user
+        # has to intervene
+        on_demand = flags & (kSCNetworkReachabilityFlagsConnectionOnTraffic
+                             | kSCNetworkReachabilityFlagsConnectionOnDemand)
+        return bool(on_demand) and not flags & kSCNetworkReachabilityFlagsInterventionRequired
+
+    def reachability_changed(self, target, flags, info):
+        """Refresh as soon as the network comes back instead of on the next tick."""
+        if self.offline and not self.pause_reasons and self.network_reachable(flags):
+            log.info("Network reachable again, refreshing")
+            self.safe_refresh(None)
+
+    def get_connection(self):
+        """Return the persistent HTTPS connection, reopening it after idle expiry."""
+        # Idle longer than any poll gap (e.g. after sleep), don't bother trying the old socket
+        if self.conn and time.monotonic() - self.last_request_at > KEEPALIVE_EXPIRY:
+            self.close_connection()
+        if self.conn is None:
+            self.conn = HTTPSConnection(API_HOST, timeout=15, context=self.ssl_context)
+        return self.conn
+
+    def request_usage(self, token):
+        """Send the usage GET and return (response, body).
+
+        If the server has since closed a kept-alive socket, reconnect once
+        straight away rather than spend a retry attempt and its backoff on it.
+        """
+        while True:
+            conn = self.get_connection()
+            reused = conn.sock is not None
+            try:
+                self.last_request_at = time.monotonic()
+                conn.request('GET', USAGE_PATH, headers={
+                    'Authorization': f'Bearer {token}',
+                    'anthropic-beta': 'oauth-2025-04-20'
+                })
+                resp = conn.getresponse()
+                body = resp.read()  # Drain fully so the connection can be reused
+            except (RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                self.close_connection()
+                if not reused:
+                    raise
+                log.info("Kept-alive connection was closed by the server, reconnecting")
+                continue
+
+            if resp.will_close:
+                self.close_connection()
+            return resp, body
+
+    def close_connection(self):
+        """Drop the persistent connection so the next request reconnects."""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def fetch_usage(self, force=False):
         """Fetch usage from Anthropic OAuth API with retry logic."""
+        if (not force and self.last_known_usage
+                and time.monotonic() - self.last_fetched_at < USAGE_CACHE_TTL):
+            log.info("Using recently fetched usage data")
+            return self.last_known_usage
+
+        # Manual refresh always tries, in case the reachability flags are wrong
+        self.offline = not force and not self.network_reachable()
+        if self.offline:
+            log.info("Network unreachable, skipping fetch")
+            return None
+
+        # Re-reads the keychain ahead of expiry instead of waiting for a 401
         token = self.get_token()
         if not token:
             return None
 
         for attempt in range(MAX_RETRIES):
             try:
-                resp = requests.get(
-                    'https://api.anthropic.com/api/oauth/usage',
-                    headers={
-                        'Authorization': f'Bearer {token}',
-                        'anthropic-beta': 'oauth-2025-04-20'
-                    },
-                    timeout=15
-                )
-
-                if resp.status_code == 401:
+                resp, body = self.request_usage(token)
+
+                if resp.status == 401:
                     log.warning("Token expired, refreshing...")
                     self.token = None
                     token = self.get_token(force_refresh=True)
@@ -144,57 +379,135 @@ class ClaudeUsageApp(rumps.App):
                         return None
                     continue
 
-                resp.raise_for_status()
-                data = resp.json()
-
-                # Cache successful response
-                self.last_known_usage = data
-                self.consecutive_failures = 0
-                log.info(f"Usage fetched: 5h={data.get('five_hour', {}).get('utilization')}%, "
-                        f"weekly={data.get('seven_day', {}).get('utilization')}%")
-                return data
-
-            except requests.exceptions.Timeout:
+                if resp.status != 200:
+                    log.error(f"HTTP error: {resp.status} {resp.reason}")
+                    if resp.status < 500:
+                        return None  # Client error, don't retry
+                else:
+                    data = json.loads(body)
+
+                    # Cache successful response
+                    self.last_known_usage = data
+                    self.last_fetched_at = time.monotonic()
+                    self.updated_at = datetime.now()
+                    self.consecutive_failures = 0
+                    log.info(f"Usage fetched: 5h={data.get('five_hour', {}).get('utilization')}%, "
+                            f"weekly={data.get('seven_day', {}).get('utilization')}%")
+                    return data
+
+            except SocketTimeout:
                 log.warning(f"API timeout (attempt {attempt + 1})")
-            except requests.exceptions.ConnectionError:
+                self.close_connection()
+            except (HTTPException, OSError):
                 log.warning(f"Connection error (attempt {attempt + 1})")
-            except requests.exceptions.HTTPError as e:
-                log.error(f"HTTP error: {e}")
-                if e.response.status_code >= 500:
-                    pass  # Server error, retry
-                else:
-                    return None  # Client error, don't retry
+                self.close_connection()
             except Exception as e:
                 log.error(f"Unexpected error fetching usage: {e}")
+                self.close_connection()  # May be left mid-request
 
             if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY)
+                time.sleep(retry_delay(attempt))
 
         self.consecutive_failures += 1
         return None
 
-    def safe_refresh(self, _):
-        """Wrapper around refresh with exception handling."""
+    def schedule_poll(self, delay=None):
+        """Arm a one-shot poll after delay, by default jittered around POLL_INTERVAL.
+
+        Replaces any pending poll. rumps.Timer can't be used here: start()
+        fires immediately and only applies the interval after that.
+        """
+        if delay is None:
+            delay = POLL_INTERVAL + random.uniform(-POLL_JITTER, POLL_JITTER)
+        self.poll_generation += 1
+        AppHelper.callLater(delay, self.on_poll_timer, self.poll_generation)
+
+    def cancel_poll(self):
+        """Cancel the pending poll, if any."""
+        self.poll_generation += 1
+
+    def pause_polling(self, reason):
+        """Stop polling while nobody can see the results."""
+        if not self.pause_reasons:
+            self.cancel_poll()
+            log.info(f"Polling paused ({reason})")
+        self.pause_reasons.add(reason)
+
+    def resume_polling(self, reason):
+        """Refresh immediately and restart polling once nothing is pausing it."""
+        if reason not in self.pause_reasons:
+            return
+        self.pause_reasons.discard(reason)
+        if not self.pause_reasons:
+            log.info(f"Polling resumed ({reason})")
+            # One refresh now; on_poll_timer then arms the next jittered poll
+            self.schedule_poll(0)
+
+    def on_poll_timer(self, generation):
+        """Poll callback: reschedule with fresh jitter, then refresh."""
+        if generation != self.poll_generation:
+            return  # Cancelled or superseded by a later schedule_poll
+        self.schedule_poll()
+        self.safe_refresh(None)
+
+    def safe_refresh(self, _, force=False):
+        """Show last known values now and fetch fresh usage in the background."""
+        if self.fetch_in_progress:
+            log.info("Refresh already in progress, skipping")
+            return
+
+        if self.last_known_usage and not force:
+            try:
+                self.render(self.last_known_usage)
+            except Exception as e:
+                log.error(f"Render failed with exception: {e}")
+
+        self.fetch_in_progress = True
+        threading.Thread(target=self.fetch_in_background, args=(force,), daemon=True).start()
+
+    def fetch_in_background(self, force):
+        """Fetch usage off the main thread, then hand the result back to it."""
+        usage, error = None, None
+        try:
+            usage = self.fetch_usage(force=force)
+        except Exception as e:
+            error = e
+        AppHelper.callAfter(self.finish_refresh, usage, error)
+
+    def finish_refresh(self, usage, error):
+        """Main-thread completion of a background fetch, with exception handling."""
+        self.fetch_in_progress = False
         try:
-            self.refresh()
+            if error:
+                raise error
+            self.refresh(usage)
         except Exception as e:
             log.error(f"Refresh failed with exception: {e}")
             self.show_error_state(f"Error: {str(e)[:30]}")
 
-    def refresh(self):
-        """Update display and check thresholds."""
-        usage = self.fetch_usage()
-
+    def refresh(self, usage):
+        """Update display from a fetch result, falling back to cached data."""
         if not usage:
+            if self.offline:
+                self.show_error_state("Offline")
+                return
+
             # Use cached data if available
             if self.last_known_usage and self.consecutive_failures < 5:
                 log.info("Using cached usage data")
-                usage = self.last_known_usage
-                self.status_item.title = f"Status: Cached (retry {self.consecutive_failures})"
+                self.render(self.last_known_usage)
+                self.set_title(self.status_item, f"Status: Cached (retry {self.consecutive_failures})")
             else:
                 self.show_error_state("Connection failed")
-                return
+            return
+
+        self.render(usage)
+        self.set_title(self.status_item, "Status: Connected")
+        # A cache hit from fetch_usage keeps the time of the fetch it came from
+        self.set_title(self.updated_item, f"Updated: {self.updated_at.strftime('%H:%M')}")
 
+    def render(self, usage):
+        """Update menu items and menu bar, and check thresholds."""
         five_hour = usage.get('five_hour', {})
         weekly = usage.get('seven_day', {})
 
@@ -205,22 +518,36 @@ class ClaudeUsageApp(rumps.App):
         week_reset = self.format_reset(weekly.get('resets_at'))
 
         # Update menu items
-        self.five_hour_item.title = f"5h: {five_pct:.0%} used • resets {five_reset}"
-        self.weekly_item.title = f"Weekly: {week_pct:.0%} used • resets {week_reset}"
-        self.status_item.title = "Status: Connected"
-        self.updated_item.title = f"Updated: {datetime.now().strftime('%H:%M')}"
+        self.set_title(self.five_hour_item, f"5h: {format_percent(five_pct)} used • resets {five_reset}")
+        self.set_title(self.weekly_item, f"Weekly: {format_percent(week_pct)} used • resets {week_reset}")
 
         # Update menu bar
-        self.title = self.get_title(five_pct, week_pct)
-
-        # Check thresholds
-        self.check_thresholds(five_pct, "5h limit")
-        self.check_thresholds(week_pct, "Weekly limit")
+        self.set_title(self, self.get_title(five_pct, week_pct))
+
+        # Check thresholds, sending at most one (the most severe) notification
+        pending = [n for n in (
+            self.check_thresholds(five_pct, LIMIT_LABELS[0]),
+            self.check_thresholds(week_pct, LIMIT_LABELS[1]),
+        ) if n]
+        if pending:
+            _, title, message, label, levels = max(pending, key=lambda n: n[0])
+            # Only the sent notification counts; the other limit's goes out next refresh
+            now = time.monotonic()
+            for level in levels:
+                self.notified_levels[label][level] = now
+            rumps.notification("Claude Usage Monitor", title, message)
+            log.info(f"Notification sent: {title} - {message}")
+
+    def set_title(self, item, title):
+        """Set a menu bar or menu item title, skipping the AppKit update if unchanged."""
+        if self.shown_titles.get(id(item)) != title:
+            self.shown_titles[id(item)] = title
+            item.title = title
 
     def show_error_state(self, message):
         """Show error state but keep last known values visible."""
-        self.status_item.title = f"Status: {message}"
-        self.updated_item.title = f"Last attempt: {datetime.now().strftime('%H:%M')}"
+        self.set_title(self.status_item, f"Status: {message}")
+        self.set_title(self.updated_item, f"Last attempt: {datetime.now().strftime('%H:%M')}")
 
         if self.last_known_usage:
             # Keep showing last known values with warning indicator
@@ -228,71 +555,68 @@ class ClaudeUsageApp(rumps.App):
             weekly = self.last_known_usage.get('seven_day', {})
             five_pct = five_hour.get('utilization', 0) / 100
             week_pct = weekly.get('utilization', 0) / 100
-            self.title = f"⚠️{int(five_pct*100)} {int(week_pct*100)}"
+            self.set_title(self, f"⚠️{round(five_pct*100)} {round(week_pct*100)}")
         else:
-            self.title = "⚠️"
+            self.set_title(self, "⚠️")
 
     def manual_refresh(self, _):
         """Manual refresh triggered by menu click."""
-        self.title = "⏳"
-        self.status_item.title = "Status: Refreshing..."
+        self.set_title(self, "⏳")
+        self.set_title(self.status_item, "Status: Refreshing...")
         self.consecutive_failures = 0  # Reset failure count on manual refresh
-        self.safe_refresh(None)
+        self.safe_refresh(None, force=True)
 
     def get_icon(self, pct):
         """Return emoji icon based on usage percentage."""
-        if pct >= THRESHOLDS['critical']:
-            return "🔴"
-        elif pct >= THRESHOLDS['danger']:
-            return "🟠"
-        elif pct >= THRESHOLDS['warning']:
-            return "🟡"
-        else:
-            return "🟢"
+        icon = "🟢"
+        for _, threshold, level_icon in THRESHOLDS:
+            if pct < threshold:
+                break
+            icon = level_icon
+        return icon
 
     def get_title(self, five_pct, week_pct):
         """Return compact menu bar title with both indicators."""
         five_icon = self.get_icon(five_pct)
         week_icon = self.get_icon(week_pct)
-        five_num = int(five_pct * 100)
-        week_num = int(week_pct * 100)
+        five_num = round(five_pct * 100)
+        week_num = round(week_pct * 100)
         return f"{five_icon}{five_num} {week_icon}{week_num}"
 
     def check_thresholds(self, pct, label):
-        """Send notifications at threshold crossings."""
-        for level, threshold in THRESHOLDS.items():
-            key = f"{label}_{level}"
-            if pct >= threshold and key not in self.notified_levels:
-                self.notified_levels.add(key)
-
-                if level == 'critical':
-                    title = "Usage Critical!"
-                    message = f"You've used {pct:.0%} of your {label}. Consider pausing."
-                elif level == 'danger':
-                    title = "Usage High"
-                    message = f"You've used {pct:.0%} of your {label}."
-                else:
-                    title = "Usage Warning"
-                    message = f"You've reached {pct:.0%} of your {label}."
+        """Return (severity, title, message, label, levels) for newly crossed thresholds, or None.
+
+        Levels are not marked as notified here; render does that for the
+        notification it actually sends.
+        """
+        notified = self.notified_levels[label]
+        if pct < WARNING_THRESHOLD:
+            # Re-arm levels once their cooldown has passed, so hovering around
+            # a threshold doesn't notify on every crossing
+            now = time.monotonic()
+            for level in [lv for lv, sent in notified.items() if now - sent >= NOTIFY_COOLDOWN]:
+                del notified[level]
+            return None
 
-                rumps.notification("Claude Usage Monitor", title, message)
-                log.info(f"Notification sent: {title} - {message}")
+        levels = []
+        for severity, (level, threshold, _) in enumerate(THRESHOLDS):
+            if pct < threshold:
+                break
+            if level not in notified:
+                levels.append(level)
+                top = severity
 
-        if pct < THRESHOLDS['warning']:
-            self.notified_levels = {
-                k for k in self.notified_levels
-                if not k.startswith(label)
-            }
+        if not levels:
+            return None
+        title, template = NOTIFICATIONS[levels[-1]]
+        return top, title, template.format(pct=format_percent(pct), label=label), label, levels
 
     def format_reset(self, iso_time):
         """Format reset time as relative string."""
         if not iso_time:
             return "unknown"
         try:
-            reset = datetime.fromisoformat(iso_time.replace('Z', '+00:00'))
-            now = datetime.now(reset.tzinfo)
-            diff = reset - now
-            total_seconds = int(diff.total_seconds())
+            total_seconds = int(parse_reset_epoch(iso_time) - time.time())
 
             if total_seconds < 0:
                 return "soon"
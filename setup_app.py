@@ -22,8 +22,16 @@ OPTIONS = {
         'NSHighResolutionCapable': True,
         'LSMinimumSystemVersion': '10.15',
     },
-    'packages': ['rumps', 'requests', 'urllib3', 'certifi', 'charset_normalizer', 'idna'],
-    'includes': ['json', 'logging', 'subprocess', 'time'],
+    'packages': ['rumps', 'certifi'],
+    'includes': ['http.client', 'json', 'logging', 'ssl', 'subprocess', 'threading', 'time'],
+    # Stdlib the app never reaches; keep xml.parsers.expat (plistlib) and email (http.client)
+    'excludes': [
+        'tkinter', 'unittest', 'pydoc', 'pydoc_data', 'xmlrpc', 'distutils', 'lib2to3',
+        'test', 'tests', 'email.mime', 'html', 'http.server', 'xml.dom', 'xml.sax',
+        'xml.etree', 'multiprocessing', 'concurrent', 'asyncio',
+    ],
+    'optimize': 2,  # Strip asserts and docstrings from bundled bytecode
+    'strip': True,
     # 'iconfile': 'icon.icns',  # Add later if desired
 }
 